@@ -1,150 +1,264 @@
+import functools
 import json
 import os
+import pathlib
 import shutil
 import re
 import re
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+# Per-plugin generation is I/O bound, so use more threads than cores
+_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Turns plugin directory/package names into titles
+_TITLE_TABLE = str.maketrans("_-", "  ")
+
+# rollup.config.mjs: `input`, `name` and output `file` entries
+_ROLLUP_RE = re.compile(rb"(?P<key>input|name|file)\s*:\s*['\"](?P<val>[^'\"]*)['\"]")
+
+# Plugin code (src/index.ts)
+_META_TAG_RE = re.compile(r'@(?P<tag>plugin|description|author)\s*(?P<value>.*?)(?=\n|\*/)')
+# Matches parameter and data entries alike; only parameters carry a `default`
+_FIELD_ITEM_RE = re.compile(
+    r'/\*\*(?P<description>(?:(?!\*/).)*?)\*/\s*(?P<name>\w+):\s*{\s*type:\s*(?P<type>ParameterType\.\w+)'
+    r'(?:,\s*default:\s*(?P<default>\[.*?\]|null|true|false|".*?"|\d+))?',
+    re.DOTALL,
+)
+
+# Static part of mkdocs.yml; one nav line per plugin is appended to it
+_MKDOCS_HEADER = """site_name: Sweet JsPsych
+theme:
+  name: material
+  palette:
+    - scheme: default
+      primary: black
+      toggle:
+        icon: material/brightness-7
+        name: Switch to dark mode
+
+    - scheme: slate
+      primary: black
+      toggle:
+        icon: material/brightness-4
+        name: Switch to light mode
+  features:
+    - navigation.indexes
+    - content.code.copy
+    - announce.dismiss
+nav:
+    - Home: index.md
+"""
+
+# Markdown table headers of the generated plugin pages
+_PARAMETERS_TABLE_HEADER = (
+    "| Name          | Type     | Default       | Description |\n"
+    "|---------------|----------|---------------|-------------|\n"
+)
+_DATA_TABLE_HEADER = (
+    "| Name         | Type     | Description |\n"
+    "|--------------|----------|-------------|\n"
+)
+
+# Tokens that matter when matching braces: braces, string openers and comment openers
+_BRACE_TOKEN_RE = re.compile(r"""[{}'"`]|/\*|//""")
+# Quoted strings end on their own line; template literals may span lines
+_STRING_END_RE = {
+    "'": re.compile(r"(?:[^'\\\n]|\\[\s\S])*'"),
+    '"': re.compile(r'(?:[^"\\\n]|\\[\s\S])*"'),
+    "`": re.compile(r"(?:[^`\\]|\\.)*`", re.DOTALL),
+}
+
+# Start of a `parameters: {` / `data: {` object, plus the openers of comments and strings to skip
+_BLOCK_START_RE = {
+    key: re.compile(rf"""(?<![\w$]){key}:\s*{{|['"`]|/\*|//""")
+    for key in ("parameters", "data")
+}
+
+# Fallback when brace matching fails: everything up to the last closing brace
+_GREEDY_BLOCK_RE = re.compile(r'\s*{(.*)}', re.DOTALL)
+
+
+def _walk_no_node_modules(root_dir):
+    """Recursively yield (dirpath, entry) for every file, skipping node_modules and hidden directories."""
+    try:
+        entries = os.scandir(root_dir)
+    except OSError:
+        # Like os.walk, skip directories that are missing or unreadable
+        return
+    subdirs = []
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name != "node_modules" and not entry.name.startswith("."):
+                    subdirs.append(entry.path)
+            elif entry.is_file():
+                # Symlinks to directories are neither followed nor reported as files
+                yield root_dir, entry
+    for subdir in subdirs:
+        yield from _walk_no_node_modules(subdir)
+
+
+def _scan_all(root_dir):
+    """Walk the directory once and collect every file the docs are built from."""
+    found = {
+        "readmes": [],
+        "package_jsons": [],
+        "rollup_configs": [],
+        "examples": [],
+        "additional_docs": [],
+        "plugin_code": [],
+    }
+    for dirpath, entry in _walk_no_node_modules(root_dir):
+        basename = os.path.basename(dirpath)
+        if basename == "examples":
+            found["examples"].append(entry.path)
+        elif basename == "docs":
+            found["additional_docs"].append(entry.path)
+        elif basename == "src" and entry.name.endswith("index.ts"):
+            found["plugin_code"].append(entry.path)
+        name = entry.name.lower()
+        if name == "readme.md":
+            found["readmes"].append(entry.path)
+        elif name == "package.json":
+            found["package_jsons"].append(entry.path)
+        elif name == "rollup.config.mjs":
+            found["rollup_configs"].append(entry.path)
+    return found
 
 
 def find_readmes(root_dir):
     """Recursively find all README.md files in the directory."""
-    readmes = []
-    for dirpath, _, filenames in os.walk(root_dir):
-        if not 'node_modules' in dirpath:
-            for file in filenames:
-                if file.lower() == "readme.md":
-                    readmes.append(os.path.join(dirpath, file))
-    return readmes
+    return _scan_all(root_dir)["readmes"]
 
 
 def find_package_jsons(root_dir):
     """Recursively find all package.json files in the directory."""
-    package_jsons = []
-    for dirpath, _, filenames in os.walk(root_dir):
-        if not 'node_modules' in dirpath:
-            for file in filenames:
-                if file.lower() == "package.json":
-                    package_jsons.append(os.path.join(dirpath, file))
-    return package_jsons
+    return _scan_all(root_dir)["package_jsons"]
 
 
 def find_rollup_configs(root_dir):
     """Recursively find all rollup.config.js files in the directory."""
-    rollup_configs = []
-    for dirpath, _, filenames in os.walk(root_dir):
-        if not 'node_modules' in dirpath:
-            for file in filenames:
-                if file.lower() == "rollup.config.mjs":
-                    rollup_configs.append(os.path.join(dirpath, file))
-    return rollup_configs
+    return _scan_all(root_dir)["rollup_configs"]
 
 
 def find_examples(root_dir):
-    examples = []
-    for dirpath, _, filenames in os.walk(root_dir):
-        if not 'node_modules' in dirpath:
-            if dirpath.endswith("examples"):
-                for file in filenames:
-                    examples.append(os.path.join(dirpath, file))
-    return examples
+    return _scan_all(root_dir)["examples"]
 
 
 def find_additional_docs(root_dir):
-    examples = []
-    for dirpath, _, filenames in os.walk(root_dir):
-        if not 'node_modules' in dirpath:
-            if dirpath.endswith("docs"):
-                for file in filenames:
-                    examples.append(os.path.join(dirpath, file))
-    return examples
+    return _scan_all(root_dir)["additional_docs"]
 
 
 def find_plugin_code(root_dir):
-    plugin_code = []
-    for dirpath, _, filenames in os.walk(root_dir):
-        if not 'node_modules' in dirpath:
-            if dirpath.endswith("src"):
-                for file in filenames:
-                    if file.endswith("index.ts"):
-                        plugin_code.append(os.path.join(dirpath, file))
-    return plugin_code
+    return _scan_all(root_dir)["plugin_code"]
 
 
-def copy_files_and_generate_nav(readmes, output_dir, root_dir):
+def _relative_dir(path, root_prefix):
+    """Directory of `path` relative to `root_prefix` (the root dir with a trailing separator)."""
+    dirpath = os.path.dirname(path)
+    if dirpath.startswith(root_prefix):
+        return dirpath[len(root_prefix):]
+    return os.path.relpath(dirpath, root_prefix)
+
+
+def copy_files_and_generate_nav(package_jsons, rollup_configs, output_dir, root_dir):
     """Copy README files to the output directory and generate an index file."""
     os.makedirs(output_dir, exist_ok=True)
-    nav = []
-
-    for package_file, rollup_file in zip(find_package_jsons(root_dir), find_rollup_configs(root_dir)):
-        content = create_readme_from_package_json(package_file, rollup_file)
-        relative_dir = os.path.relpath(os.path.dirname(package_file), root_dir)
-        output_path = os.path.join(output_dir, relative_dir, "index.md")
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        with open(output_path, "a") as f:
-            f.write(content)
-        link_name = relative_dir.replace("_", " ").replace('-', ' ')
-        link_name = " ".join(word.capitalize() for word in link_name.split())
-        nav.append({"name": link_name, "path": relative_dir})
+
+    root_prefix = os.path.join(root_dir, "")
+    rollup_by_dir = {os.path.dirname(path): path for path in rollup_configs}
+    package_files = []
+    rollup_files = []
+    relative_dirs = []
+    for package_file in package_jsons:
+        rollup_file = rollup_by_dir.get(os.path.dirname(package_file))
+        if rollup_file is None:
+            print(f"No rollup.config.mjs found next to {package_file}, skipping.")
+            continue
+        package_files.append(package_file)
+        rollup_files.append(rollup_file)
+        relative_dirs.append(_relative_dir(package_file, root_prefix))
+
+    # Create every output directory once, up front, instead of in each worker
+    for relative_dir in set(relative_dirs):
+        os.makedirs(f"{output_dir}/{relative_dir}", exist_ok=True)
+
+    write_readme = functools.partial(_write_plugin_readme, output_dir=output_dir)
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+        nav = list(executor.map(write_readme, package_files, rollup_files, relative_dirs))
 
     return nav
 
 
-def create_mkdocs_yaml(nav):
-    content = """site_name: Sweet JsPsych
-theme:
-  name: material
-  palette:
-    - scheme: default
-      primary: black
-      toggle:
-        icon: material/brightness-7
-        name: Switch to dark mode
-
-    - scheme: slate
-      primary: black
-      toggle:
-        icon: material/brightness-4
-        name: Switch to light mode
-  features:
-    - navigation.indexes
-    - content.code.copy
-    - announce.dismiss
-nav:
-    - Home: index.md
-"""
-    for section in nav:
-        content += f"    - {section['name']}: {section['path']}\n"
-    with open("../../mkdocs.yml", "w") as f:
+def _write_plugin_readme(package_file, rollup_file, relative_dir, output_dir):
+    """Append the generated README of one plugin to its index file and return its nav entry."""
+    content = create_readme_from_package_json(package_file, rollup_file)
+    with open(f"{output_dir}/{relative_dir}/index.md", "a", encoding="utf-8", newline="") as f:
         f.write(content)
+    link_name = relative_dir.translate(_TITLE_TABLE)
+    link_name = " ".join(word.capitalize() for word in link_name.split())
+    return {"name": link_name, "path": relative_dir}
+
+
+def create_mkdocs_yaml(nav):
+    parts = [_MKDOCS_HEADER]
+    parts.extend(f"    - {section['name']}: {section['path']}\n" for section in nav)
+    with open("../../mkdocs.yml", "w", encoding="utf-8", newline="") as f:
+        f.write("".join(parts))
 
 
 def extract_rollup_config_with_regex(rollup_config_path):
     """Extract information from rollup.config.mjs using regex."""
+    stat = os.stat(rollup_config_path)
+    return _extract_rollup_config_cached(rollup_config_path, stat.st_mtime_ns, stat.st_size)
 
-    with open(rollup_config_path, "r") as file:
-        config_content = file.read()
-
-    # Regex to match the `input` file
-    input_match = re.search(r"input\s*:\s*['\"](.*?)['\"]", config_content)
 
-    # Regex to match the `name` property in the output section
-    name_match = re.search(r"name\s*:\s*['\"](.*?)['\"]", config_content)
+@functools.lru_cache(maxsize=1024)
+def _extract_rollup_config_cached(rollup_config_path, mtime_ns, size):
+    """Parse a rollup config; `mtime_ns` and `size` only key the cache so edited files are re-read."""
+    with open(rollup_config_path, "rb") as file:
+        config_content = file.read()
 
-    # Regex to match all output file paths
-    output_matches = re.findall(r"file\s*:\s*['\"](.*?)['\"]", config_content)
+    input_ = None
+    name = None
+    outputs = []
+    # Single pass: the first `input` and `name` win, every `file` is an output
+    for match in _ROLLUP_RE.finditer(config_content):
+        key = match.group("key")
+        value = match.group("val").decode("utf-8")
+        if key == b"file":
+            outputs.append(value)
+        elif key == b"input":
+            if input_ is None:
+                input_ = value
+        elif name is None:
+            name = value
 
     # Return the extracted data
     return {
-        "input": input_match.group(1) if input_match else "Not specified",
-        "name": name_match.group(1) if name_match else "Not specified",
-        "outputs": output_matches if output_matches else []
+        "input": input_ if input_ is not None else "Not specified",
+        "name": name if name is not None else "Not specified",
+        "outputs": outputs
     }
 
 
+def _load_package_json(package_json):
+    """Load a package.json, re-reading it only if it changed since the last call."""
+    stat = os.stat(package_json)
+    return _load_package_json_cached(package_json, stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=1024)
+def _load_package_json_cached(package_json, mtime_ns, size):
+    """Parse a package.json, cached per (path, mtime, size)."""
+    with open(package_json, "rb") as f:
+        return json.load(f)
+
+
 def create_readme_from_package_json(package_json, rollup_config):
     """Generate a README.md file from a package.json file."""
-    with open(package_json, "r") as f:
-        package_data = json.load(f)
+    package_data = _load_package_json(package_json)
 
     rollup_data = extract_rollup_config_with_regex(rollup_config)
 
@@ -156,7 +270,7 @@ def create_readme_from_package_json(package_json, rollup_config):
     # Extract details from rollup.config.js
     class_name = rollup_data.get("name", "Not specifie")
 
-    title = name[22:].replace("_", " ").replace('-', ' ')
+    title = name[22:].translate(_TITLE_TABLE)
 
     # Create README content
     return f"""
@@ -184,57 +298,128 @@ jsPsych 7.0.0
 """
 
 
+def _extract_block(code, key):
+    """Return the text between the braces of the first `key: {...}` object outside comments and strings."""
+    pos = 0
+    while True:
+        token = _BLOCK_START_RE[key].search(code, pos)
+        if token is None:
+            return None
+        pos = token.end()
+        text = token.group()
+        if text in _STRING_END_RE or text in ("/*", "//"):
+            end = _skip_comment_or_string(code, text, pos)
+            if end is None and text in ("/*", "//"):
+                return None
+            # An unterminated template literal is skipped over like a single character
+            pos = end if end is not None else pos
+            continue
+        brace = token.end() - 1
+        block = _match_braces(code, brace)
+        if block is None:
+            # e.g. an unterminated template literal inside the block
+            greedy_match = _GREEDY_BLOCK_RE.match(code, brace)
+            block = greedy_match.group(1) if greedy_match else None
+        return block
+
+
+def _match_braces(code, open_index):
+    """Return the text inside the braces opening at `open_index`, skipping strings and comments."""
+    depth = 0
+    pos = open_index
+    while True:
+        token = _BRACE_TOKEN_RE.search(code, pos)
+        if token is None:
+            return None
+        pos = token.end()
+        char = token.group()
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return code[open_index + 1:token.start()]
+        else:
+            pos = _skip_comment_or_string(code, char, pos)
+            if pos is None:
+                return None
+
+
+def _skip_comment_or_string(code, opener, pos):
+    """Return the position after the comment or string `opener` starts, or None if it never ends."""
+    if opener == "/*":
+        end = code.find("*/", pos)
+        return None if end == -1 else end + 2
+    if opener == "//":
+        end = code.find("\n", pos)
+        return None if end == -1 else end + 1
+    # A quote not closed on its own line is no string, e.g. the one in `/'/`
+    string_end = _STRING_END_RE[opener].match(code, pos)
+    if string_end is not None:
+        return string_end.end()
+    return None if opener == "`" else pos
+
+
+def _plugin_header(plugin_code):
+    """Return the JSDoc comment that documents the plugin class (the one with `@plugin`)."""
+    tag = plugin_code.find("@plugin")
+    if tag == -1:
+        return ""
+    start = plugin_code.rfind("/**", 0, tag)
+    end = plugin_code.find("*/", tag)
+    return plugin_code[max(start, 0):len(plugin_code) if end == -1 else end + 2]
+
+
 def create_site_from_code(plugin_code):
     # Input: Plugin Code
 
-    # Extract Plugin Metadata
-    plugin_name = re.search(r'@plugin\s*(.*?)\n', plugin_code).group(1)
-    plugin_description = re.search(r'@description\s*(.*?)\n', plugin_code).group(1)
-    plugin_author = re.search(r'@author\s(.*?)\n', plugin_code, re.DOTALL).group(1).strip()
-
-    # Extract Parameters
-    parameters_block = re.search(r'parameters:\s*{(.*)}', plugin_code, re.DOTALL).group(1)
-    parameter_matches = re.finditer(
-        r'/\*\*(.*?)\*/\s*(\w+):\s*{\s*type:\s*(ParameterType\.\w+),\s*default:\s*(\[.*?\]|null|true|false|".*?"|\d+)',
-        parameters_block,
-        re.DOTALL,
-    )
+    # Extract Plugin Metadata from the JSDoc block holding `@plugin`
+    metadata = {}
+    for match in _META_TAG_RE.finditer(_plugin_header(plugin_code)):
+        metadata.setdefault(match.group("tag"), match.group("value"))
+    for tag in ("plugin", "description", "author"):
+        if tag not in metadata:
+            raise ValueError(f"Plugin code has no `@{tag}` tag in its JSDoc header")
+    plugin_name = metadata["plugin"]
+    plugin_description = metadata["description"]
+    plugin_author = metadata["author"].strip()
+
+    # Extract Parameters and Data in a single pass over both blocks
+    parameters_block = _extract_block(plugin_code, "parameters")
+    data_block = _extract_block(plugin_code, "data")
+    if parameters_block is None:
+        raise ValueError("Plugin code has no `parameters: {...}` block")
+    if data_block is None:
+        raise ValueError("Plugin code has no `data: {...}` block")
+    # Descriptions cannot run past a `*/`, so no match spans the two blocks
+    data_offset = len(parameters_block) + 1
+    field_matches = _FIELD_ITEM_RE.finditer(parameters_block + "\n" + data_block)
 
     parameters = []
-    for match in parameter_matches:
-        description = match.group(1).strip().replace("*", "").replace("\n", " ")
-        name = match.group(2)
-        param_type = match.group(3).replace("ParameterType.", "")
-        default = match.group(4).strip()
-        parameters.append({"name": name, "type": param_type, "default": default, "description": description})
+    data_fields = []
+    for match in field_matches:
+        description = match.group("description").strip().replace("*", "").replace("\n", " ")
+        name = match.group("name")
+        field_type = match.group("type").replace("ParameterType.", "")
+        if match.start() >= data_offset:
+            data_fields.append({"name": name, "type": field_type, "description": description})
+        elif match.group("default") is not None:
+            # Only entries with a default are parameters
+            default = match.group("default").strip()
+            parameters.append({"name": name, "type": field_type, "default": default, "description": description})
 
     # Generate Markdown Table
-    parameters_table = "| Name          | Type     | Default       | Description |\n"
-    parameters_table += "|---------------|----------|---------------|-------------|\n"
-    for param in parameters:
-        parameters_table += f"| {param['name']} | {param['type']} | {str(param['default'])} | {param['description']} |\n"
-
-    # Extract Data
-    data_block = re.search(r'data:\s*{(.*)}', plugin_code, re.DOTALL).group(1)
-    data_matches = re.finditer(
-        r'/\*\*(.*?)\*/\s*(\w+):\s*{\s*type:\s*(ParameterType\.\w+)',
-        data_block,
-        re.DOTALL,
+    rows = [_PARAMETERS_TABLE_HEADER]
+    rows.extend(
+        f"| {param['name']} | {param['type']} | {param['default']} | {param['description']} |\n"
+        for param in parameters
     )
-
-    # Process data fields
-    data_fields = []
-    for match in data_matches:
-        description = match.group(1).strip().replace("*", "").replace("\n", " ")
-        name = match.group(2)
-        data_type = match.group(3).replace("ParameterType.", "")
-        data_fields.append({"name": name, "type": data_type, "description": description})
+    parameters_table = "".join(rows)
 
     # Generate Markdown Table
-    data_table = "| Name         | Type     | Description |\n"
-    data_table += "|--------------|----------|-------------|\n"
-    for field in data_fields:
-        data_table += f"| {field['name']} | {field['type']} | {field['description']} |\n"
+    rows = [_DATA_TABLE_HEADER]
+    rows.extend(f"| {field['name']} | {field['type']} | {field['description']} |\n" for field in data_fields)
+    data_table = "".join(rows)
 
     # Generate Markdown Documentation
     doc_lines = [
@@ -254,34 +439,59 @@ def create_site_from_code(plugin_code):
     return "\n".join(doc_lines)
 
 
-def create_sites_from_code(root_dir):
-    for path in find_plugin_code(root_dir):
-        txt = open(path, 'r').read()
+def create_sites_from_code(plugin_code, root_dir):
+    write_site = functools.partial(_write_plugin_site, root_prefix=os.path.join(root_dir, ""))
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+        list(executor.map(write_site, plugin_code))
+
+
+def _read_source(path):
+    """Read a whole source file with a single os.read sized from fstat."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        data = os.read(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+    # Text mode used to translate Windows line endings; keep the regexes working on \n
+    if b"\r" in data:
+        data = data.replace(b"\r\n", b"\n")
+    return data.decode("utf-8")
+
+
+def _write_plugin_site(path, root_prefix):
+    txt = _read_source(path)
+    try:
         content = create_site_from_code(txt)
-        relative_dir = os.path.relpath(os.path.dirname(path), root_dir)
+    except ValueError as e:
+        raise ValueError(f"{path}: {e}") from e
+    relative_dir = _relative_dir(path, root_prefix)
 
-        output_path = os.path.join("../../docs", relative_dir[:-4], "index.md")
-        with open(output_path, "w") as f:
-            f.write(content)
+    with open(f"../../docs/{relative_dir[:-4]}/index.md", "w", encoding="utf-8", newline="") as f:
+        f.write(content)
 
 
-def add_examples(root_dir):
-    for path in find_examples(root_dir):
-        relative_dir = os.path.relpath(os.path.dirname(path), root_dir)
-        output_path = os.path.join("../../docs", relative_dir[:-9], "index.md")
-        with open(output_path, "a") as f:
-            if '## Examples' not in open(output_path, 'r').read():
-                f.write(f"\n\n## Examples\n\n```html\n{open(path, 'r').read()}\n```")
+def add_examples(examples, root_dir):
+    root_prefix = os.path.join(root_dir, "")
+    for path in examples:
+        relative_dir = _relative_dir(path, root_prefix)
+        output_path = f"../../docs/{relative_dir[:-9]}/index.md"
+        existing = pathlib.Path(output_path).read_text(encoding="utf-8") if os.path.exists(output_path) else ''
+        example_text = pathlib.Path(path).read_text(encoding="utf-8")
+        with open(output_path, "a", encoding="utf-8", newline="") as f:
+            if '## Examples' not in existing:
+                f.write(f"\n\n## Examples\n\n```html\n{example_text}\n```")
             else:
-                f.write(f"\n\n```html\n{open(path, 'r').read()}\n```")
+                f.write(f"\n\n```html\n{example_text}\n```")
 
 
-def add_additional_docs(root_dir):
-    for path in find_additional_docs(root_dir):
-        relative_dir = os.path.relpath(os.path.dirname(path), root_dir)
-        output_path = os.path.join("../../docs", relative_dir[:-4], "index.md")
-        with open(output_path, "a") as f:
-            f.write(f"\n\n{open(path, 'r').read()}\n")
+def add_additional_docs(additional_docs, root_dir):
+    root_prefix = os.path.join(root_dir, "")
+    for path in additional_docs:
+        relative_dir = _relative_dir(path, root_prefix)
+        output_path = f"../../docs/{relative_dir[:-4]}/index.md"
+        doc_text = pathlib.Path(path).read_text(encoding="utf-8")
+        with open(output_path, "a", encoding="utf-8", newline="") as f:
+            f.write(f"\n\n{doc_text}\n")
 
 
 def main():
@@ -289,18 +499,19 @@ def main():
     root_dir = "../../plugins"
     output_dir = "../../docs"
 
-    # Find all README.md files
-    readmes = find_readmes(root_dir)
+    # Find all source files in a single pass
+    found = _scan_all(root_dir)
+    readmes = found["readmes"]
     if not readmes:
         print("No README.md files found.")
         return
-    create_sites_from_code(root_dir)
+    create_sites_from_code(found["plugin_code"], root_dir)
 
     # Generate the documentation
-    nav = copy_files_and_generate_nav(readmes, output_dir, root_dir)
+    nav = copy_files_and_generate_nav(found["package_jsons"], found["rollup_configs"], output_dir, root_dir)
     create_mkdocs_yaml(nav)
-    add_additional_docs(root_dir)
-    add_examples(root_dir)
+    add_additional_docs(found["additional_docs"], root_dir)
+    add_examples(found["examples"], root_dir)
 
 
 if __name__ == "__main__":